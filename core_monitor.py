@@ -1,19 +1,141 @@
 # core_monitor.py
 
 import os
+import mmap
 import random
+import signal
+import threading
 import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from email.mime.text import MIMEText
 import smtplib
+import sqlite3
 import re
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor, ThreadPoolExecutor
 from bs4 import BeautifulSoup
+import soupsieve as sv
+
+try:
+    import lxml  # noqa: F401  (C tree builder for BeautifulSoup, optional)
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+
+# ---------- PRECOMPILED PATTERNS ----------
+
+PRICE_RE = re.compile(r"\$?([\d,]+\.?\d*)")
+SHIP_COST_RE = re.compile(r"(free)|\$([\d,]+\.?\d*)", re.IGNORECASE)
+SHIP_FALLBACK_RE = re.compile(r"\+\s*\$([\d,]+\.?\d*)")
+TIME_LEFT_RE = re.compile(r"(\d+)\s*([dhm])")
+FULL_DATE_RE = re.compile(r"\(([A-Za-z]{3,9}\s+\d{1,2},\s+\d{4}\s+\d{1,2}:\d{2}\s*[AP]M)\)")
+TODAY_TOMORROW_RE = re.compile(r"\((Today|Tomorrow)\s+(\d{1,2}:\d{2}\s*[AP]M)\)", re.IGNORECASE)
+ITM_ID_RE = re.compile(r"/itm/(\d+)")
+
+
+# ---------- LISTING CONTAINERS ----------
+
+# Tried in order; the first selector that matches anything wins.
+CONTAINER_SELECTORS = [
+    "li.s-card",
+    "li.s-item",
+    "ul.srp-results.srp-list > li",
+    "div.s-card",
+    "div.s-item",
+]
+
+# Raw byte markers for the selectors above. A file with none of these
+# cannot contain result containers, so it is skipped without parsing.
+CONTAINER_MARKERS = (b"s-card", b"s-item", b"srp-results")
+
+
+def _read_html_if_listings(path):
+    """
+    Return the decoded HTML for path, or "" if the raw bytes contain none of
+    CONTAINER_MARKERS. The marker scan runs on an mmap of the file, so
+    irrelevant pages are never decoded or handed to BeautifulSoup.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if not any(mm.find(marker) != -1 for marker in CONTAINER_MARKERS):
+                return ""
+            html = mm[:].decode("utf-8", errors="ignore")
+
+    # Match what text-mode reading used to hand the parser
+    if "\r" in html:
+        html = html.replace("\r\n", "\n").replace("\r", "\n")
+    return html
+
+
+# ---------- PRECOMPILED SELECTORS ----------
+# Compiled once with soupsieve (the engine behind bs4's .select) so the
+# per-listing loop does not re-parse the same selector strings.
+
+CONTAINER_MATCHERS = [sv.compile(sel) for sel in CONTAINER_SELECTORS]
+TITLE_SEL = sv.compile(
+    ".s-item__title, .s-card__title, .s-item__info .s-item__title, [data-testid='item-title']"
+)
+PRICE_SEL = sv.compile(
+    ".s-card__price, .s-item__price, .s-item__detail .s-item__price, [data-testid='item-price']"
+)
+SHIPPING_SEL = sv.compile(
+    ".s-card__shipping, .s-card__logisticsCost, "
+    ".s-item__shipping, .s-item__logisticsCost, "
+    "[data-testid='item-shipping']"
+)
+TIME_LEFT_SEL = sv.compile(
+    ".s-item__time-left, .s-card__time-left, .s-item__dynamic .LIGHT_HIGHLIGHT"
+)
+TIME_END_SEL = sv.compile(".s-card__time-end, .s-item__time-end")
+LINK_SEL = sv.compile("a.s-item__link, a.s-card__link, a[href*='itm/'], a")
 
 
 # ---------- EMAIL SENDING ----------
 
-def send_mailgun_email(subject: str, body_html: str, mailgun_config: dict) -> None:
-    """Generic Mailgun email sender used by all markets."""
+# One authenticated SMTP session reused across sends: (key, smtplib.SMTP).
+_SMTP_SESSION = None
+
+
+def _close_smtp_session():
+    global _SMTP_SESSION
+    if _SMTP_SESSION is not None:
+        try:
+            _SMTP_SESSION[1].quit()
+        except Exception:
+            pass
+        _SMTP_SESSION = None
+
+
+def _get_smtp_session(mailgun_config: dict) -> smtplib.SMTP:
+    """
+    Return a logged-in SMTP connection, reusing the previous one when it is
+    for the same server/login and still answers NOOP.
+    """
+    global _SMTP_SESSION
+    key = (mailgun_config["server"], mailgun_config["port"], mailgun_config["login"])
+
+    if _SMTP_SESSION is not None:
+        cached_key, server = _SMTP_SESSION
+        if cached_key == key:
+            try:
+                if server.noop()[0] == 250:
+                    return server
+            except Exception:
+                pass
+        _close_smtp_session()
+
+    server = smtplib.SMTP(mailgun_config["server"], mailgun_config["port"], timeout=30)
+    server.starttls()
+    server.login(mailgun_config["login"], mailgun_config["password"])
+    _SMTP_SESSION = (key, server)
+    return server
+
+
+def send_mailgun_email(subject: str, body_html: str, mailgun_config: dict) -> bool:
+    """Generic Mailgun email sender used by all markets. Returns True if sent."""
     from_email = mailgun_config["from_email"]
     to_emails = mailgun_config["to_emails"]
 
@@ -27,72 +149,77 @@ def send_mailgun_email(subject: str, body_html: str, mailgun_config: dict) -> No
     print(f"[EMAIL] Subj: {subject}")
 
     try:
-        server = smtplib.SMTP(
-            mailgun_config["server"],
-            mailgun_config["port"],
-        )
-        server.starttls()
-        server.login(mailgun_config["login"], mailgun_config["password"])
-        server.sendmail(from_email, to_emails, msg.as_string())
-        server.quit()
+        try:
+            _get_smtp_session(mailgun_config).sendmail(from_email, to_emails, msg.as_string())
+        except smtplib.SMTPServerDisconnected:
+            # The server dropped the idle session between NOOP and send; retry once fresh.
+            _close_smtp_session()
+            _get_smtp_session(mailgun_config).sendmail(from_email, to_emails, msg.as_string())
         print(f"✓ Email sent to: {', '.join(to_emails)}")
+        return True
     except Exception as e:
+        _close_smtp_session()
         print(f"✗ Failed to send email: {e}")
+        return False
 
 
 # ---------- LISTINGS HELPER (SHARED) ----------
 
-def parse_ebay_search_html(path):
+def parse_ebay_search_html(path, with_html=False):
     """
     Extract standardized listing data from ANY eBay layout (s-card, s-item, legacy).
     Returns a list of dicts containing:
     title, item_price, shipping, price (total), link, time_left
+
+    With with_html=True, returns (listings, html) instead, so callers that
+    also need the page text (e.g. coin-type detection) don't read it twice.
+    html is "" when the file could not be read or has no listings.
     
     This is the SINGLE SOURCE OF TRUTH for HTML parsing.
     All monitors should use this function.
     """
-    results = []
-
     try:
-        with open(path, "r", encoding="utf-8", errors="ignore") as f:
-            html = f.read()
+        html = _read_html_if_listings(path)
     except Exception as e:
         print(f"  [ERROR] Could not read {path}: {e}")
+        html = ""
+        results = []
+    else:
+        results = _parse_listings_html(html, os.path.basename(path))
+    return (results, html) if with_html else results
+
+
+def _parse_listings_html(html, name="file"):
+    # name labels the log lines; in a worker pool several files log at once
+    results = []
+
+    if not html:
+        print(f"  [WARN] {name}: No result containers found with known selectors.")
         return results
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER)
 
     # --- Collect nodes from multiple possible layouts ---
-    container_selectors = [
-        "li.s-card",
-        "li.s-item",
-        "ul.srp-results.srp-list > li",
-        "div.s-card",
-        "div.s-item",
-    ]
-
     nodes = []
-    for sel in container_selectors:
-        found = soup.select(sel)
+    for matcher in CONTAINER_MATCHERS:
+        found = matcher.select(soup)
         if found:
-            #print(f"  [DEBUG] Selector '{sel}' matched {len(found)} elements")
+            #print(f"  [DEBUG] Selector '{matcher.pattern}' matched {len(found)} elements")
             nodes = found
             break
 
     if not nodes:
-        print("  [WARN] No result containers found with known selectors.")
+        print(f"  [WARN] {name}: No result containers found with known selectors.")
         return results
 
-    print(f"  [DEBUG] Using {len(nodes)} elements as result items")
+    print(f"  [DEBUG] {name}: Using {len(nodes)} elements as result items")
 
     for node in nodes:
         try:
             # -------------------------------
             # TITLE
             # -------------------------------
-            title_elem = node.select_one(
-                ".s-item__title, .s-card__title, .s-item__info .s-item__title, [data-testid='item-title']"
-            )
+            title_elem = TITLE_SEL.select_one(node)
             if not title_elem:
                 continue
             
@@ -114,14 +241,12 @@ def parse_ebay_search_html(path):
             # -------------------------------
             # PRICE
             # -------------------------------
-            price_elem = node.select_one(
-                ".s-card__price, .s-item__price, .s-item__detail .s-item__price, [data-testid='item-price']"
-            )
+            price_elem = PRICE_SEL.select_one(node)
             if not price_elem:
                 continue
 
             price_text = price_elem.get_text(strip=True)
-            m = re.search(r"\$?([\d,]+\.?\d*)", price_text)
+            m = PRICE_RE.search(price_text)
             if not m:
                 continue
 
@@ -131,31 +256,23 @@ def parse_ebay_search_html(path):
             # SHIPPING (ROBUST - handles multiple formats)
             # -------------------------------
             shipping_cost = 0.0
-            shipping_text = ""
+            ship_match = None
 
-            # Try explicit shipping elements first
-            ship_elem = node.select_one(
-                ".s-card__shipping, .s-card__logisticsCost, "
-                ".s-item__shipping, .s-item__logisticsCost, "
-                "[data-testid='item-shipping']"
-            )
+            # Try explicit shipping elements first.
+            # One pass: "Free ..." -> 0.0, otherwise the first "$X" amount.
+            ship_elem = SHIPPING_SEL.select_one(node)
 
             if ship_elem:
-                shipping_text = ship_elem.get_text(" ", strip=True)
-                shipping_lower = shipping_text.lower()
-                
-                if "free" in shipping_lower:
-                    shipping_cost = 0.0
-                else:
-                    ship_match = re.search(r"\$([\d,]+\.?\d*)", shipping_text)
-                    if ship_match:
-                        shipping_cost = float(ship_match.group(1).replace(",", ""))
+                ship_match = SHIP_COST_RE.search(ship_elem.get_text(" ", strip=True))
+                if ship_match and ship_match.group(2):
+                    shipping_cost = float(ship_match.group(2).replace(",", ""))
 
-            # Fallback #1: detect "+$4.52 shipping" or "+$4.52 delivery" in full card text
-            if shipping_cost == 0.0 and (not shipping_text or "free" not in shipping_text.lower()):
+            # Fallback #1: no shipping element (or it said neither "free" nor "$X"):
+            # detect "+$4.52 shipping" or "+$4.52 delivery" in full card text
+            if ship_match is None:
                 full_text = node.get_text(" ", strip=True)
                 # Look for patterns like "+$4.52", "+ $4.52", "+$4.52 shipping"
-                fallback_match = re.search(r"\+\s*\$([\d,]+\.?\d*)", full_text)
+                fallback_match = SHIP_FALLBACK_RE.search(full_text)
                 if fallback_match:
                     try:
                         shipping_cost = float(fallback_match.group(1).replace(",", ""))
@@ -166,10 +283,8 @@ def parse_ebay_search_html(path):
             # -------------------------------
             # TIME LEFT
             # -------------------------------
-            time_left_elem = node.select_one(
-                ".s-item__time-left, .s-card__time-left, .s-item__dynamic .LIGHT_HIGHLIGHT"
-            )
-            time_end_elem = node.select_one(".s-card__time-end, .s-item__time-end")
+            time_left_elem = TIME_LEFT_SEL.select_one(node)
+            time_end_elem = TIME_END_SEL.select_one(node)
             
             if time_left_elem:
                 time_left = time_left_elem.get_text(strip=True)
@@ -181,9 +296,7 @@ def parse_ebay_search_html(path):
             # -------------------------------
             # LINK
             # -------------------------------
-            link_elem = node.select_one(
-                "a.s-item__link, a.s-card__link, a[href*='itm/'], a"
-            )
+            link_elem = LINK_SEL.select_one(node)
             link = ""
             if link_elem and link_elem.has_attr("href"):
                 link = link_elem["href"]
@@ -203,25 +316,29 @@ def parse_ebay_search_html(path):
             results.append(listing)
 
         except Exception as e:
-            print(f"  [ERROR] Error parsing listing: {e}")
+            print(f"  [ERROR] {name}: Error parsing listing: {e}")
             continue
 
-    print(f"  [DEBUG] Successfully parsed {len(results)} listings from file")
+    print(f"  [DEBUG] Successfully parsed {len(results)} listings from {name}")
     return results
 
 
 # ---------- TIME-LEFT HELPERS (SHARED) ----------
 
+@lru_cache(maxsize=4096)
 def parse_time_left_to_minutes_for_sort(time_left_str: str) -> int:
     """
     Lightweight time-left parser for sorting hits in the email.
     Returns minutes (int) or a large number if parsing fails.
+
+    Pure string -> int, so results are memoized (the same "2d 3h" style
+    strings repeat across listings and cycles).
     """
     if not time_left_str:
         return 10**9
 
     s = time_left_str.lower()
-    matches = re.findall(r"(\d+)\s*([dhm])", s)
+    matches = TIME_LEFT_RE.findall(s)
     if not matches:
         return 10**9
 
@@ -245,11 +362,16 @@ def parse_end_datetime_from_time_left(time_left_str: str):
     """
     if not time_left_str:
         return None
+    # "Today"/"Tomorrow" depend on the current date, so it is part of the cache key
+    return _parse_end_datetime(time_left_str, datetime.now().date())
+
 
+@lru_cache(maxsize=4096)
+def _parse_end_datetime(time_left_str: str, today):
     s = time_left_str.strip()
 
     # 1) Full date format like '(Dec 10, 2025 3:30 PM)'
-    m = re.search(r"\(([A-Za-z]{3,9}\s+\d{1,2},\s+\d{4}\s+\d{1,2}:\d{2}\s*[AP]M)\)", s)
+    m = FULL_DATE_RE.search(s)
     if m:
         try:
             return datetime.strptime(m.group(1), "%b %d, %Y %I:%M %p")
@@ -257,12 +379,12 @@ def parse_end_datetime_from_time_left(time_left_str: str):
             pass
 
     # 2) Today / Tomorrow formats
-    m = re.search(r"\((Today|Tomorrow)\s+(\d{1,2}:\d{2}\s*[AP]M)\)", s, re.IGNORECASE)
+    m = TODAY_TOMORROW_RE.search(s)
     if m:
         day_word = m.group(1).lower()
         time_part = m.group(2)
         try:
-            base_date = datetime.now().date()
+            base_date = today
             if day_word == "tomorrow":
                 base_date = base_date + timedelta(days=1)
             dt = datetime.strptime(time_part, "%I:%M %p")
@@ -275,41 +397,261 @@ def parse_end_datetime_from_time_left(time_left_str: str):
 
 # ---------- CLEANUP ----------
 
+CLEANUP_WORKERS = 8
+
+
+def _unlink_or_error(full_path: str):
+    try:
+        os.unlink(full_path)
+        return None
+    except Exception as e:
+        return e
+
+
 def delete_processed_html(file_paths):
     """
     Delete only the HTML files that were actually processed
     by this market's monitor.
+
+    Unlinks run on a small thread pool and are reported as one summary
+    line; only failures are logged per file.
     """
-    for full_path in file_paths:
-        filename = os.path.basename(full_path)
-        if not filename.lower().endswith(".html"):
-            continue
-        try:
-            os.remove(full_path)
-            print(f"[CLEANUP] Deleted: {filename}")
-        except Exception as e:
-            print(f"[CLEANUP] Could not delete {filename}: {e}")
+    targets = [p for p in file_paths if p.lower().endswith(".html")]
+    if not targets:
+        return
+
+    if len(targets) == 1:
+        errors = [_unlink_or_error(targets[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=min(CLEANUP_WORKERS, len(targets))) as ex:
+            errors = list(ex.map(_unlink_or_error, targets))
+
+    deleted = 0
+    for full_path, err in zip(targets, errors):
+        if err is None:
+            deleted += 1
+        else:
+            print(f"[CLEANUP] Could not delete {os.path.basename(full_path)}: {err}")
+    print(f"[CLEANUP] Deleted {deleted} of {len(targets)} processed HTML file(s)")
 
 
 # ---------- HIT DE-DUPE KEY ----------
 
-def make_hit_key(filename_label: str, listing: dict):
+def make_hit_key(filename_label: str, listing: dict) -> str:
     """
-    Build a stable key for a HIT so we can avoid duplicate alerts.
+    Build a stable string key for a HIT so we can avoid duplicate alerts.
+
+    Prefer the eBay item ID from the link (/itm/1234567890) -> "itm:<id>".
+    If there's no usable link, fallback to "fallback|filename|title|price".
 
-    Prefer the eBay item ID from the link (/itm/1234567890).
-    If there's no usable link, fallback to (filename, title, price).
+    The extracted item ID is cached on the listing as "_itm_id"
+    ("" when the link has none), so repeat calls skip the regex.
     """
-    link = listing.get("link") or ""
-    # Try to extract item ID from the URL
-    m = re.search(r"/itm/(\d+)", link)
-    if m:
-        return ("itm", m.group(1))
+    itm_id = listing.get("_itm_id")
+    if itm_id is None:
+        # Try to extract item ID from the URL
+        m = ITM_ID_RE.search(listing.get("link") or "")
+        itm_id = m.group(1) if m else ""
+        listing["_itm_id"] = itm_id
+
+    if itm_id:
+        return f"itm:{itm_id}"
 
     # Fallback: use filename + title + rounded total price
     title = listing.get("title", "")
     price = round(listing.get("price", 0.0), 2)
-    return ("fallback", filename_label, title, price)
+    return f"fallback|{filename_label}|{title}|{price:.2f}"
+
+
+# ---------- SEEN-HITS STORE ----------
+
+SEEN_HITS_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "seen_hits.db")
+SEEN_HITS_TTL_DAYS = 30  # listings have long ended by then
+
+
+class SeenHitsStore:
+    """
+    Hit keys we've already alerted on, persisted in SQLite.
+
+    - Survives restarts, so a crash/redeploy does not re-send old HITs.
+    - Each key keeps its first-seen time; keys older than ttl_days are
+      swept so the table stays bounded in a long-running monitor.
+    - Supports `key in store` and `store.update(keys)` like the set it
+      replaces.
+    """
+
+    def __init__(self, path: str = SEEN_HITS_DB_PATH, ttl_days: float = SEEN_HITS_TTL_DAYS):
+        self.ttl_seconds = int(ttl_days * 24 * 60 * 60)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS seen (key TEXT PRIMARY KEY, ts INTEGER NOT NULL)")
+        self.conn.commit()
+        self.sweep()
+
+    def __contains__(self, key: str) -> bool:
+        row = self.conn.execute("SELECT 1 FROM seen WHERE key = ?", (key,)).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+
+    def update(self, keys) -> None:
+        """Record keys as seen (first-seen time is kept for existing keys)."""
+        now = int(time.time())
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO seen (key, ts) VALUES (?, ?)",
+                [(k, now) for k in keys],
+            )
+
+    def sweep(self) -> None:
+        """Drop keys first seen more than ttl_days ago."""
+        cutoff = int(time.time()) - self.ttl_seconds
+        with self.conn:
+            self.conn.execute("DELETE FROM seen WHERE ts < ?", (cutoff,))
+
+
+# ---------- FILE ANALYSIS (SHARED) ----------
+
+def _ignore_sigint():
+    """Pool worker initializer: Ctrl+C is handled by the parent process only."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def make_parse_executor(config, max_workers=None):
+    """
+    Build the pool analyze_files fans files out to.
+
+    config["parse_executor"]  -> "process" (default) or "thread"
+    config["max_parse_workers"] -> pool size cap (default os.cpu_count())
+
+    HTML parsing + regex work is CPU-bound and holds the GIL, so a process
+    pool is what actually scales with cores. The analyzer must be picklable
+    for that (the silver analyzer is stateless).
+    """
+    if max_workers is None:
+        max_workers = int(config.get("max_parse_workers") or os.cpu_count() or 1)
+    if config.get("parse_executor", "process") == "thread":
+        return ThreadPoolExecutor(max_workers=max_workers)
+    # Workers share the console's process group, so without this each idle
+    # worker would print its own KeyboardInterrupt traceback on Ctrl+C.
+    return ProcessPoolExecutor(max_workers=max_workers, initializer=_ignore_sigint)
+
+
+def analyze_files(analyzer, html_files, config, executor=None):
+    """
+    Run analyzer.analyze_file over every HTML file and return the results
+    as a list of (path, (oz_per_coin, listings, hits)) in sorted-path order.
+
+    Files are independent, so when there is more than one they are fanned
+    out to a pool. ex.map keeps the output order deterministic.
+
+    Pass a long-lived executor (see make_parse_executor) to reuse its
+    workers; on Windows each new worker process re-imports the monitor, and
+    worker-side caches only pay off if the workers outlive the cycle.
+    Without one, a pool is built for this call and shut down afterwards.
+
+    If the analyzer has report_file(path, result, config), pooled runs pass
+    config["defer_report"] = True so workers skip their console output, and
+    report_file is then called here for each file in order. Per-file tables
+    therefore print whole and in sorted order instead of interleaving.
+    """
+    paths = sorted(html_files)
+    if len(paths) <= 1:
+        return [(p, analyzer.analyze_file(p, config)) for p in paths]
+
+    max_workers = min(int(config.get("max_parse_workers") or os.cpu_count() or 1), len(paths))
+    report = getattr(analyzer, "report_file", None)
+    worker_config = dict(config, defer_report=True) if report else config
+    configs = [worker_config] * len(paths)
+
+    # Hand each process worker a few files per round-trip on big batches
+    # (thread pools ignore chunksize)
+    chunksize = max(1, len(paths) // (max_workers * 4))
+    if executor is not None:
+        results = list(executor.map(analyzer.analyze_file, paths, configs, chunksize=chunksize))
+    else:
+        with make_parse_executor(config, max_workers) as ex:
+            results = list(ex.map(analyzer.analyze_file, paths, configs, chunksize=chunksize))
+
+    if report:
+        for path, result in zip(paths, results):
+            report(path, result, config)
+    return list(zip(paths, results))
+
+
+# ---------- WAITING FOR NEW FILES ----------
+
+NEW_FILE_POLL_SECONDS = 2.0      # how often the folder's mtime is checked while waiting
+NEW_FILE_DEBOUNCE_SECONDS = 2.0  # quiet period so a multi-file dump is handled as one batch
+
+# Set to end run_monitor; every wait in the loop wakes on it immediately.
+_stop_event = threading.Event()
+
+
+def stop_monitor():
+    """Ask a running run_monitor loop to exit after its current step."""
+    _stop_event.set()
+
+
+def _install_stop_handlers():
+    """Route SIGTERM (and SIGBREAK on Windows) to stop_monitor."""
+    for name in ("SIGTERM", "SIGBREAK"):
+        signum = getattr(signal, name, None)
+        if signum is None:
+            continue
+        try:
+            signal.signal(signum, lambda *_: stop_monitor())
+        except ValueError:
+            # Only the main thread may install handlers; fall back to stop_monitor().
+            return
+
+
+def _folder_mtime(folder_path: str):
+    try:
+        return os.stat(folder_path).st_mtime
+    except OSError:
+        return None
+
+
+def wait_for_new_files(folder_path: str, max_wait: float) -> bool:
+    """
+    Sleep up to max_wait seconds, returning early once the folder changes
+    (a saved page landing in it updates the folder's mtime).
+
+    Only one stat per NEW_FILE_POLL_SECONDS is done while idle; the folder
+    is not listed. Once a change is seen we wait until it has been quiet for
+    NEW_FILE_DEBOUNCE_SECONDS so several pages saved together are picked up
+    in the same cycle.
+
+    Returns True if woken by a folder change, False if max_wait elapsed.
+    """
+    deadline = time.monotonic() + max_wait
+    last_mtime = _folder_mtime(folder_path)
+
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        if _stop_event.wait(min(NEW_FILE_POLL_SECONDS, remaining)):
+            return False
+
+        mtime = _folder_mtime(folder_path)
+        if mtime == last_mtime:
+            continue
+
+        # Debounce: keep waiting while the folder is still changing
+        while True:
+            last_mtime = mtime
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return True
+            if _stop_event.wait(min(NEW_FILE_DEBOUNCE_SECONDS, remaining)):
+                return False
+            mtime = _folder_mtime(folder_path)
+            if mtime == last_mtime:
+                return True
 
 
 # ---------- CORE LOOP ----------
@@ -364,11 +706,18 @@ def run_monitor(
         print("ERROR: folder_path does not exist. Please update it.")
         return
 
-    seen_hits = set()
+    seen_hits_path = config.get("seen_hits_path") or SEEN_HITS_DB_PATH
+    seen_hits = SeenHitsStore(seen_hits_path)
+    print(f"Loaded {len(seen_hits)} previously alerted HIT(s) from {seen_hits_path}\n")
     cycle_index = 0
     cycles_with_files = 0
+    _stop_event.clear()
+    _install_stop_handlers()
+    # Built on the first multi-file cycle and kept for the whole run, so
+    # worker start-up and worker-side caches are not thrown away per cycle.
+    parse_pool = None
 
-    while True:
+    while not _stop_event.is_set():
         try:
             cycle_index += 1
             print(f"[{datetime.now().strftime('%H:%M:%S')}] Starting scan cycle #{cycle_index}...")
@@ -376,13 +725,15 @@ def run_monitor(
             # Only pick files that:
             #   - are HTML
             #   - match this market's filename_filter
-            html_files = [
-                os.path.join(folder_path, f)
-                for f in os.listdir(folder_path)
-                if f.lower().endswith(".html") and filename_filter(f)
-            ]
+            with os.scandir(folder_path) as it:
+                html_files = [
+                    entry.path
+                    for entry in it
+                    if entry.name.lower().endswith(".html") and filename_filter(entry.name)
+                ]
 
             if not html_files:
+                # Nothing to parse, dedupe or delete; go straight to the wait.
                 print(
                     "  No matching HTML files found in folder for this market. "
                     f"(cycles with files so far: {cycles_with_files} out of {cycle_index})"
@@ -394,22 +745,25 @@ def run_monitor(
                     f"(cycles with files so far: {cycles_with_files}, total cycles: {cycle_index})"
                 )
 
-            all_hits = []
-
-            for fpath in sorted(html_files):
-                _, _, hits = analyzer.analyze_file(fpath, config)
-                all_hits.extend(hits)
-
-            # Filter out hits we've already alerted on
-            new_hits = []
-            for hit_entry in all_hits:
-                # hit_entry is (filename_label, listing, calc, extra_data)
-                filename_label, listing = hit_entry[0], hit_entry[1]
-                key = make_hit_key(filename_label, listing)
-                if key not in seen_hits:
-                    new_hits.append(hit_entry)
-
             if html_files:
+                all_hits = []
+
+                if parse_pool is None and len(html_files) > 1:
+                    parse_pool = make_parse_executor(config)
+                for _, (_, _, hits) in analyze_files(analyzer, html_files, config, parse_pool):
+                    all_hits.extend(hits)
+
+                # Filter out hits we've already alerted on
+                new_hits = []
+                new_keys = []
+                for hit_entry in all_hits:
+                    # hit_entry is (filename_label, listing, calc, extra_data)
+                    filename_label, listing = hit_entry[0], hit_entry[1]
+                    key = make_hit_key(filename_label, listing)
+                    if key not in seen_hits:
+                        new_hits.append(hit_entry)
+                        new_keys.append(key)
+
                 if new_hits:
                     # Determine earliest ending time for subject line
                     earliest_dt = None
@@ -435,36 +789,45 @@ def run_monitor(
 
                     subject = f"{earliest_clock} Offline eBay {config.get('market_name', 'Market')} HITS ({len(new_hits)} new)"
                     body_html = build_email_body(new_hits, config)
-                    send_mailgun_email(subject, body_html, mailgun_config)
-
-                    for hit_entry in new_hits:
-                        filename_label, listing = hit_entry[0], hit_entry[1]
-                        key = make_hit_key(filename_label, listing)
-                        seen_hits.add(key)
+                    # Only remember HITs that were actually mailed; the store is
+                    # persistent, so recording a failed send would drop them for good.
+                    if send_mailgun_email(subject, body_html, mailgun_config):
+                        seen_hits.update(new_keys)
+                        seen_hits.sweep()
+                    else:
+                        print("  HITs not recorded as alerted; they will be mailed when seen again.")
                 else:
                     print(
                         "\nNo NEW HITs found across processed files. No email sent.\n"
                         f"(cycles with files so far: {cycles_with_files} out of {cycle_index})"
                     )
-            else:
-                # No files this cycle; we've already logged that fact above.
-                pass
 
-            # Delete only the HTML files we actually processed for this market
-            if html_files:
+                # Delete only the HTML files we actually processed for this market
                 delete_processed_html(html_files)
 
-            # Jittered sleep: +/- 60 seconds, never below 60s
+            # Jittered wait: +/- 60 seconds, never below 60s.
+            # Cut short as soon as new files land in the folder.
             base_seconds = check_interval_min * 60
             jitter = random.randint(-60, 60)
             wait_time = max(60, base_seconds + jitter)
-            print(f"  Waiting {wait_time/60:.2f} minutes (with randomness)...\n")
-            time.sleep(wait_time)
+            print(f"  Waiting up to {wait_time/60:.2f} minutes (with randomness) or until new files arrive...\n")
+            if wait_for_new_files(folder_path, wait_time):
+                print("  Folder changed; starting next cycle early.")
+            elif _stop_event.is_set():
+                print("\n\nMonitoring stopped.")
 
         except KeyboardInterrupt:
             print("\n\nMonitoring stopped by user.")
             break
         except Exception as e:
             print(f"Error in loop: {e}")
+            if isinstance(e, BrokenExecutor) and parse_pool is not None:
+                # A worker died; start a fresh pool next cycle
+                parse_pool.shutdown(wait=False, cancel_futures=True)
+                parse_pool = None
             print("Sleeping 60 seconds before retry...\n")
-            time.sleep(60)
+            _stop_event.wait(60)
+
+    if parse_pool is not None:
+        parse_pool.shutdown()
+    _close_smtp_session()
@@ -11,7 +11,9 @@ FMV priority order (always exactly one source):
 
 import os
 import re
+import mmap
 import json
+import heapq
 import urllib.parse
 
 # ----------------------------
@@ -25,6 +27,16 @@ SOLD_PAGES_DIR = r"C:\Users\Triston Barker\ebay\ebay_sold_pages"
 SOLD_FLOOR_PCT = 0.20
 SOLD_MIN_SAMPLES = 6
 
+# ----------------------------
+# Patterns (compiled once)
+# ----------------------------
+
+# Year plus optional mint mark ("1893", "1893-S", "1878 cc") in one scan
+YEAR_MINT_RE = re.compile(r"\b((?:18|19|20)\d{2})\b(?:\s*[-/ ]\s*(CC|[PDOS])\b)?", re.IGNORECASE)
+HTML_PRICE_RE = re.compile(r"\$\s*([0-9][0-9,]*\.?[0-9]{0,2})")
+# Same pattern over raw UTF-8 bytes; ASCII whitespace or NBSP (\xc2\xa0) may follow the "$"
+HTML_PRICE_RE_BYTES = re.compile(rb"\$(?:\s|\xc2\xa0)*([0-9][0-9,]*\.?[0-9]{0,2})")
+
 # ----------------------------
 # Helpers
 # ----------------------------
@@ -36,26 +48,50 @@ def build_ebay_sold_search_url(query: str) -> str:
 def _extract_year_mint(text: str):
     if not text:
         return None
-    m = re.search(r"\b(18|19|20)\d{2}\b", text)
-    if not m:
-        return None
-    year = m.group(0)
-    m2 = re.search(rf"{year}\s*[-/ ]\s*(CC|[PDOS])\b", text, re.IGNORECASE)
-    if m2:
-        return f"{year}-{m2.group(1).upper()}"
+    year = None
+    # First year wins; its mint may sit on a later repeat ("1936+1936-D")
+    for m in YEAR_MINT_RE.finditer(text):
+        y, mint = m.groups()
+        if year is None:
+            year = y
+        elif y != year:
+            continue
+        if mint:
+            return f"{year}-{mint.upper()}"
     return year
 
 # ----------------------------
 # PCGS CACHE (Source #1)
 # ----------------------------
 
-def pcgs_fmv(title: str):
-    if not os.path.exists(PCGS_CACHE_PATH):
-        return None, None
+_PCGS_CACHE = None        # parsed cache dict (None = not loaded yet)
+_PCGS_CACHE_MTIME = None  # mtime of the file _PCGS_CACHE came from
 
+def _load_pcgs_cache():
+    """
+    Return the PCGS cache as a dict, parsing the JSON file only when it is
+    first needed or has changed on disk since the last load.
+    Missing or unreadable cache -> {}.
+    """
+    global _PCGS_CACHE, _PCGS_CACHE_MTIME
     try:
-        data = json.load(open(PCGS_CACHE_PATH, "r", encoding="utf-8"))
-    except Exception:
+        mtime = os.stat(PCGS_CACHE_PATH).st_mtime
+    except OSError:
+        return {}
+
+    if _PCGS_CACHE is None or mtime != _PCGS_CACHE_MTIME:
+        try:
+            with open(PCGS_CACHE_PATH, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception:
+            data = {}
+        _PCGS_CACHE = data if isinstance(data, dict) else {}
+        _PCGS_CACHE_MTIME = mtime
+    return _PCGS_CACHE
+
+def pcgs_fmv(title: str):
+    data = _load_pcgs_cache()
+    if not data:
         return None, None
 
     lower = title.lower()
@@ -85,15 +121,23 @@ def pcgs_fmv(title: str):
 # EBAY SOLD (Source #2)
 # ----------------------------
 
-def _parse_prices_from_html(html: str):
-    prices = []
-    for m in re.finditer(r"\$\s*([0-9][0-9,]*\.?[0-9]{0,2})", html):
-        try:
-            prices.append(float(m.group(1).replace(",", "")))
-        except Exception:
-            pass
+def _parse_prices_from_html(html):
+    # One findall pass; every match starts with a digit so float() is safe.
+    # Accepts str or a bytes-like buffer (e.g. an mmap of the SOLD page).
+    if isinstance(html, str):
+        prices = [float(m.replace(",", "")) for m in HTML_PRICE_RE.findall(html)]
+    else:
+        prices = [float(m.replace(b",", b"")) for m in HTML_PRICE_RE_BYTES.findall(html)]
     return [p for p in prices if 5.0 <= p <= 100000.0]
 
+def _parse_prices_from_file(path: str):
+    """Scan a SOLD page for prices straight from a read-only mmap, without decoding it."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _parse_prices_from_html(mm)
+
 def ebay_sold_fmv(title: str):
     if not os.path.isdir(SOLD_PAGES_DIR):
         return None, None
@@ -124,17 +168,16 @@ def ebay_sold_fmv(title: str):
 
     path = os.path.join(SOLD_PAGES_DIR, best)
     try:
-        html = open(path, "r", encoding="utf-8", errors="ignore").read()
+        prices = _parse_prices_from_file(path)
     except Exception:
         return None, None
 
-    prices = _parse_prices_from_html(html)
     if len(prices) < SOLD_MIN_SAMPLES:
         return None, None
 
-    prices.sort()
+    # Only the bottom k are needed, so skip the full sort
     k = max(1, int(len(prices) * SOLD_FLOOR_PCT))
-    floor = sum(prices[:k]) / k
+    floor = sum(heapq.nsmallest(k, prices)) / k
 
     return float(floor), f"eBay SOLD (offline floor avg, bottom {int(SOLD_FLOOR_PCT*100)}%, {k}/{len(prices)} used)"
 
@@ -152,29 +195,48 @@ def coinbook_fmv(title: str):
 # ----------------------------
 
 NUMISMATIC_RULES = [
-    {"label": "1878-CC Morgan Dollar", "est_value": 200.0, "pattern": r"\b1878\s*[- ]?cc\b", "must": ["morgan"]},
-    {"label": "1892-S Morgan Dollar", "est_value": 140.0, "pattern": r"\b1892\s*[- ]?s\b", "must": ["morgan"]},
-    {"label": "1895-O Morgan Dollar", "est_value": 900.0, "pattern": r"\b1895\s*[- ]?o\b", "must": ["morgan"]},
-    {"label": "1928 Peace Dollar",     "est_value": 170.0, "pattern": r"\b1928\b",          "must": ["peace"]},
+    {"label": "1878-CC Morgan Dollar", "est_value": 200.0, "pattern": re.compile(r"\b1878\s*[- ]?cc\b", re.IGNORECASE), "must": ["morgan"]},
+    {"label": "1892-S Morgan Dollar", "est_value": 140.0, "pattern": re.compile(r"\b1892\s*[- ]?s\b", re.IGNORECASE), "must": ["morgan"]},
+    {"label": "1895-O Morgan Dollar", "est_value": 900.0, "pattern": re.compile(r"\b1895\s*[- ]?o\b", re.IGNORECASE), "must": ["morgan"]},
+    {"label": "1928 Peace Dollar",     "est_value": 170.0, "pattern": re.compile(r"\b1928\b", re.IGNORECASE),          "must": ["peace"]},
 ]
 
+# Every rule's required tokens, so titles mentioning none of the series
+# names ("morgan", "peace", ...) skip every rule pattern.
+_RULE_TOKENS = frozenset(tok for rule in NUMISMATIC_RULES for tok in rule["must"])
+
+# All rule patterns fused into one alternation, used only as a gate: one
+# search says whether ANY rule pattern occurs in the title. It cannot say
+# which ones, since at a given position the first matching branch wins and
+# hides later rules anchored there, so candidates re-run their own pattern.
+_RULES_RE = re.compile(
+    "|".join(f"(?:{rule['pattern'].pattern})" for rule in NUMISMATIC_RULES),
+    re.IGNORECASE,
+)
+
+def _matching_rules(title: str):
+    """Rules whose required tokens and pattern both match the title, in table order."""
+    lower = title.lower()
+    if not any(tok in lower for tok in _RULE_TOKENS):
+        return []
+    if not _RULES_RE.search(title):
+        return []
+    return [
+        rule for rule in NUMISMATIC_RULES
+        if all(tok in lower for tok in rule["must"]) and rule["pattern"].search(title)
+    ]
+
 # ----------------------------
 # MAIN ENTRY
 # ----------------------------
 
 def check_numismatic_override(listing, calc, config):
     title = listing.get("title", "")
-    lower = title.lower()
 
     payout_pct = float(config.get("numismatic_payout_pct", 0.0))
     payout_frac = payout_pct / 100.0 if payout_pct > 0 else 0.0
 
-    for rule in NUMISMATIC_RULES:
-        if not re.search(rule["pattern"], title, re.IGNORECASE):
-            continue
-        if any(tok not in lower for tok in rule["must"]):
-            continue
-
+    for rule in _matching_rules(title):
         # --- FMV resolution ---
         fmv, src = pcgs_fmv(title)
         if fmv is None:
@@ -23,6 +23,8 @@ Summary: Set true max → enter once → don’t react.
 import os
 import re
 import html as html_lib
+from collections import namedtuple
+from functools import lru_cache
 from bs4 import BeautifulSoup  # may be used by core_monitor parsers
 from datetime import datetime, timedelta
 
@@ -31,6 +33,7 @@ from core_monitor import (
     parse_time_left_to_minutes_for_sort,
     parse_end_datetime_from_time_left,
     parse_ebay_search_html,
+    TIME_LEFT_RE,
 )
 from mail_config import MAILGUN_CONFIG
 
@@ -50,6 +53,10 @@ MAX_MARGIN = 60.0           # maximum % margin to count as HIT (melt-based)
 MAX_TIME_HOURS = 0.5        # only consider items ending in <= this many hours; set None to disable
 BID_OFFSET = 0              # extra dollars you expect to bid above current total (item+shipping)
 
+# Per-file parsing runs in a pool when a cycle finds more than one HTML file
+PARSE_EXECUTOR = "process"  # "process" (uses all cores) or "thread"
+MAX_PARSE_WORKERS = None    # upper bound on pool size; None = one per CPU core
+
 # ==========================
 # NUMISMATIC OVERRIDE RULES
 # ==========================
@@ -269,18 +276,13 @@ NUMISMATIC_RULES = [
     # ============================================================
 
     # 1916-S (~80–100)
+    # Sellers write both "Walking Liberty" and "Walker"; either one counts
     {
         "label": "1916-S Walking Liberty Half",
         "est_value": 80.0,
         "pattern": re.compile(r"\b1916\s*[-/ ]?s\b", re.IGNORECASE),
-        "must_contain": ["walking", "half"],
-        "max_qty": 2,
-    },
-    {
-        "label": "1916-S Walker Half",
-        "est_value": 80.0,
-        "pattern": re.compile(r"\b1916\s*[-/ ]?s\b", re.IGNORECASE),
-        "must_contain": ["walker", "half"],
+        "must_contain": ["half"],
+        "must_contain_any": ["walking", "walker"],
         "max_qty": 2,
     },
 
@@ -294,13 +296,8 @@ NUMISMATIC_RULES = [
     },
 
     # 1921, 1921-D, 1921-S — all very strong in G–VG
-    {
-        "label": "1921 Walking Liberty Half",
-        "est_value": 200.0,
-        "pattern": re.compile(r"\b1921(?![0-9])", re.IGNORECASE),
-        "must_contain": ["walking", "half"],
-        "max_qty": 2,
-    },
+    # (the mint-marked rules come first so the bare-year rule only takes
+    # titles without a D/S)
     {
         "label": "1921-D Walking Liberty Half",
         "est_value": 220.0,
@@ -315,6 +312,13 @@ NUMISMATIC_RULES = [
         "must_contain": ["walking", "half"],
         "max_qty": 2,
     },
+    {
+        "label": "1921 Walking Liberty Half",
+        "est_value": 200.0,
+        "pattern": re.compile(r"\b1921(?![0-9])", re.IGNORECASE),
+        "must_contain": ["walking", "half"],
+        "max_qty": 2,
+    },
 
     # 1938-D (~90–130)
     {
@@ -330,18 +334,19 @@ NUMISMATIC_RULES = [
     # ============================================================
 
     # Specific early key dates in G–VG
+    # Micro O variety first; the plain 1892-O rule matches it too
     {
-        "label": "1892-O Barber Half",
-        "est_value": 90.0,
+        "label": "1892-O Micro O Barber Half",
+        "est_value": 150.0,
         "pattern": re.compile(r"\b1892\s*[-/ ]?o\b", re.IGNORECASE),
-        "must_contain": ["barber", "half"],
+        "must_contain": ["barber", "half", "micro"],
         "max_qty": 1,
     },
     {
-        "label": "1892-O Micro O Barber Half",
-        "est_value": 150.0,
+        "label": "1892-O Barber Half",
+        "est_value": 90.0,
         "pattern": re.compile(r"\b1892\s*[-/ ]?o\b", re.IGNORECASE),
-        "must_contain": ["barber", "half", "micro"],
+        "must_contain": ["barber", "half"],
         "max_qty": 1,
     },
     {
@@ -521,31 +526,196 @@ NUMISMATIC_RULES = [
     },
 ]
 
+# ---------- Compiled rule table ----------
+# The literal table above stays readable dicts; at import it is turned into
+# NumismaticRule tuples (plain attribute access in the per-listing loop).
+#
+# - match_numismatic_rule is handed a title the caller already lowercased
+#   (listing_title_lc), and every rule literal is lowercase, so patterns are
+#   matched without IGNORECASE.
+# - required_mask: one bit per distinct must_contain token (TOKEN_BITS), so
+#   "all tokens present" is a single integer AND against the title's mask.
+#   any_mask does the same for must_contain_any ("at least one present").
+# - date_key: almost every rule is "<year><sep><mint>", a bare "<year>", or
+#   "<year>" with any suffix. Those are parsed out of the pattern into a
+#   (year, mint) key ("" = bare year, "*" = any suffix) and answered by one
+#   YEAR_MINT_RE pass plus dict lookups. Anything else (generic Carson
+#   City, high-grade Barber) keeps date_key=None and its own regex.
+
+NumismaticRule = namedtuple(
+    "NumismaticRule",
+    "label est_value pattern must_contain max_qty required_mask any_mask date_key",
+)
+
+# One walk over the title yields every year, whether a word boundary follows
+# it, and the mint letter(s) written after it. The mint position is fixed by
+# the text (first non-space char, or the one after a "-"/"/"), so each year
+# occurrence has at most one mint, exactly as the per-rule patterns see it.
+YEAR_MINT_RE = re.compile(
+    r"\b(1[89][0-9]{2})(?:\b(?P<edge>)|(?![0-9]))(?:\s*[-/ ]?(?P<mint>cc|[a-z])\b)?"
+)
+
+# Only dates YEAR_MINT_RE can capture (18xx/19xx, mint "cc" or one letter)
+# get a date_key; any other rule (e.g. 2021-S) stays on the irregular path
+# and keeps its own regex, instead of getting a key no title can produce.
+_RULE_DATE_RES = (
+    (re.compile(r"\\b(1[89]\d{2})\\s\*\[-/ \]\?(cc|[a-z])\\b"), None),
+    (re.compile(r"\\b(1[89]\d{2})\\b"), ""),
+    (re.compile(r"\\b(1[89]\d{2})\(\?!\[0-9\]\)"), "*"),
+)
+
+TOKEN_BITS = {}
+
+
+def _rule_date_key(pat):
+    for rx, mint in _RULE_DATE_RES:
+        m = rx.fullmatch(pat)
+        if m:
+            return (m.group(1), m.group(2) if mint is None else mint)
+    return None
+
+
+def _token_mask(tokens):
+    mask = 0
+    for tok in tokens:
+        mask |= TOKEN_BITS.setdefault(tok, 1 << len(TOKEN_BITS))
+    return mask
+
+
+def _compile_rule(d):
+    must = tuple(t.lower() for t in d.get("must_contain") or ())
+    must_any = tuple(t.lower() for t in d.get("must_contain_any") or ())
+    pat = d["pattern"].pattern
+    return NumismaticRule(
+        label=d["label"],
+        est_value=float(d["est_value"]),
+        pattern=re.compile(pat),
+        must_contain=must,
+        max_qty=d.get("max_qty"),
+        required_mask=_token_mask(must),
+        any_mask=_token_mask(must_any),
+        date_key=_rule_date_key(pat),
+    )
+
+
+# Table order is priority order: the first rule that matches wins, so a
+# specific variety sits above the generic rule it overlaps (1921-D before
+# 1921, Micro O before 1892-O), and halves sit above the Seated dollars
+# whose "seated" + "dollar" tokens every "half dollar" title also carries.
+NUMISMATIC_RULES = [_compile_rule(d) for d in NUMISMATIC_RULES]
+
+# (year, mint) -> indices into NUMISMATIC_RULES, in priority order
+RULES_BY_DATE = {}
+for _i, _rule in enumerate(NUMISMATIC_RULES):
+    if _rule.date_key is not None:
+        RULES_BY_DATE.setdefault(_rule.date_key, []).append(_i)
+RULES_IRREGULAR = [r for r in NUMISMATIC_RULES if r.date_key is None]
+_IRREGULAR_IDX = frozenset(i for i, r in enumerate(NUMISMATIC_RULES) if r.date_key is None)
+
+
+def candidate_numismatic_rules(title_lower):
+    """
+    Rules that could match this title, in NUMISMATIC_RULES order: every
+    date-keyed rule whose date appears, plus the irregular rules (which
+    still need their own pattern check).
+    """
+    found = None
+    for m in YEAR_MINT_RE.finditer(title_lower):
+        year = m.group(1)
+        keys = [(year, "*")]
+        if m.group("edge") is not None:
+            keys.append((year, ""))
+        mint = m.group("mint")
+        if mint:
+            keys.append((year, mint))
+        for key in keys:
+            idx = RULES_BY_DATE.get(key)
+            if idx:
+                if found is None:
+                    found = set(_IRREGULAR_IDX)
+                found.update(idx)
+    if found is None:
+        return RULES_IRREGULAR
+    return [NUMISMATIC_RULES[i] for i in sorted(found)]
+
+
+def title_token_mask(title_lower):
+    """Bitmask of the TOKEN_BITS tokens present in an already-lowercased title."""
+    mask = 0
+    for tok, bit in TOKEN_BITS.items():
+        if tok in title_lower:
+            mask |= bit
+    return mask
+
+
+# Relisted items repeat the same title cycle after cycle (and across the
+# files of one cycle), so the title -> rule answer is memoised. In a process
+# pool the cache lives in each worker and is shared by the files it handles.
+@lru_cache(maxsize=65536)
+def match_numismatic_rule(title_lower, qty):
+    """First NumismaticRule matching a lowercased title at this quantity, or None."""
+    title_mask = title_token_mask(title_lower)
+    if not title_mask:
+        # Every rule needs at least one series token
+        return None
+
+    for rule in candidate_numismatic_rules(title_lower):
+        max_qty = rule.max_qty
+        if max_qty is not None and qty > max_qty:
+            continue
+
+        # All tokens in must_contain must appear in the title
+        required = rule.required_mask
+        if title_mask & required != required:
+            continue
+        # ...and at least one of must_contain_any, if the rule has it
+        if rule.any_mask and not title_mask & rule.any_mask:
+            continue
+
+        # Date-keyed rules were already matched by candidate_numismatic_rules
+        if rule.date_key is not None or rule.pattern.search(title_lower):
+            return rule
+
+    return None
+
+
+_CLOCK_RE = re.compile(r"\d{1,2}:\d{2}\s*[AP]M")
+
 
 def extract_display_time_for_subject(time_left):
     """Extract the clock portion from '(Today 05:40 PM)' if present."""
     if not time_left:
         return None
-    m = re.search(r"\(.*?(\d{1,2}:\d{2}\s*[AP]M).*\)", time_left)
+    # Only the span between the first "(" and the last ")" can hold the clock
+    open_idx = time_left.find("(")
+    if open_idx < 0:
+        return None
+    close_idx = time_left.rfind(")")
+    if close_idx <= open_idx:
+        return None
+    m = _CLOCK_RE.search(time_left, open_idx + 1, close_idx)
     if m:
-        return m.group(1)
+        return m.group(0)
     return None
 
 
+def listing_title_lc(listing):
+    """Lowercased title, computed once and cached on the listing as "_title_lc"."""
+    tl = listing.get("_title_lc")
+    if tl is None:
+        tl = listing["_title_lc"] = (listing.get("title") or "").lower()
+    return tl
+
+
 # ==========================
 # ANALYZER CLASS
 # ==========================
 
 class EbayOfflineAnalyzer:
-    def __init__(self):
-        pass
-
-    # ---------- Quantity Extraction ----------
-    def extract_quantity(self, title):
-        if not title:
-            return 1
-        t = title.lower()
-        patterns = [
+    # Tried in order; the first that yields a plausible lot size wins
+    QTY_PATTERNS = tuple(
+        re.compile(p)
+        for p in (
             r"\blot\s+of\s+(\d{1,3})(?!\.)\b",
             r"\broll\s+of\s+(\d{1,3})(?!\.)\b",
             r"\b(\d{1,3})(?!\.)\s+coins?\b",
@@ -556,9 +726,26 @@ class EbayOfflineAnalyzer:
             r"^\s*(\d{1,3})(?!\.)\b",
             r"\bqty[:\s]*(\d{1,3})(?!\.)\b",
             r"\b(\d{1,3})(?!\.)\s*pcs\b",
-        ]
-        for pat in patterns:
-            m = re.search(pat, t)
+        )
+    )
+    TIME_UNIT_MINUTES = {"d": 24 * 60, "h": 60, "m": 1}
+    OLD_DATE_RE = re.compile(r"\b18\d{2}\b")
+
+    def __init__(self):
+        pass
+
+    # ---------- Quantity Extraction ----------
+    def extract_quantity(self, title):
+        if not title:
+            return 1
+        return self._quantity_for(title.lower())
+
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _quantity_for(t):
+        # Titles repeat across cycles (and relists), so results are memoised
+        for pat in EbayOfflineAnalyzer.QTY_PATTERNS:
+            m = pat.search(t)
             if m:
                 qty = int(m.group(1))
                 if 1 < qty <= 600:
@@ -572,22 +759,17 @@ class EbayOfflineAnalyzer:
         """Parse an eBay 'time left' string into total minutes."""
         if not time_left_str:
             return None
+        return self._minutes_for(time_left_str.lower())
 
-        s = time_left_str.lower()
-        matches = re.findall(r"(\d+)\s*([dhm])", s)
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _minutes_for(s):
+        # Time-left strings repeat heavily across listings and cycles
+        matches = TIME_LEFT_RE.findall(s)
         if not matches:
             return None
-
-        total_minutes = 0
-        for num_str, unit in matches:
-            n = int(num_str)
-            if unit == "d":
-                total_minutes += n * 24 * 60
-            elif unit == "h":
-                total_minutes += n * 60
-            elif unit == "m":
-                total_minutes += n
-        return total_minutes
+        mult = EbayOfflineAnalyzer.TIME_UNIT_MINUTES
+        return sum(int(num_str) * mult[unit] for num_str, unit in matches)
 
     # ---------- Coin Type Detection ----------
     def detect_oz_per_coin(self, file_path, html_text):
@@ -596,30 +778,38 @@ class EbayOfflineAnalyzer:
         This is used for melt/pawn math ONLY; numismatic overrides ignore it.
         """
         fname = os.path.basename(file_path).lower()
-        text = (html_text or "").lower()
         HALF = 0.36169
         FULL_DOLLAR = 0.77344
         EAGLE = 0.99
 
-        def contains(word):
-            return word in fname or word in text
+        # Lowercasing a saved page copies megabytes, so each token group is
+        # checked against the filename first and the page is only lowercased
+        # when the filename alone does not settle that group.
+        text = None
+
+        def contains_any(words):
+            nonlocal text
+            if any(w in fname for w in words):
+                return True
+            if text is None:
+                text = (html_text or "").lower()
+            return any(w in text for w in words)
 
         # First, explicitly recognize "half dollar" so we don't
         # accidentally treat Seated/LIBERTY DOLLAR pages as halves.
         half_tokens = ["half dollar", "half-dollar", "half_dollar", " 50c", " 50 c"]
-        if any(contains(w) for w in half_tokens):
+        if contains_any(half_tokens):
             return HALF
 
         # Silver dollars (Morgan, Peace, Seated Dollar, etc.)
         # If "dollar" appears WITHOUT "half", treat as full dollar.
-        if "dollar" in fname or "dollar" in text:
+        if contains_any(["dollar"]):
             # Already ruled out "half dollar" above.
             return FULL_DOLLAR
 
         # Common half-dollar families (if the denomination isn't explicit)
-        if any(
-            contains(w)
-            for w in [
+        if contains_any(
+            [
                 "barber",
                 "franklin",
                 "kennedy",
@@ -633,7 +823,7 @@ class EbayOfflineAnalyzer:
             return HALF
 
         # Silver eagles (~1 oz)
-        if contains("silver eagle") or contains("american eagle"):
+        if contains_any(["silver eagle", "american eagle"]):
             return EAGLE
 
         # Fallback: assume half dollar weight
@@ -641,20 +831,18 @@ class EbayOfflineAnalyzer:
 
     # ---------- HTML Parsing ----------
     def parse_file(self, path):
-        listings = parse_ebay_search_html(path)
+        # The parser hands back the page text it already read, so the file
+        # is not opened a second time for coin-type detection.
+        listings, html_text = parse_ebay_search_html(path, with_html=True)
         if not listings:
             return None, []
 
-        try:
-            with open(path, "r", encoding="utf-8", errors="ignore") as f:
-                html_text = f.read()
-        except Exception as e:
-            print(f"Could not read file {path}: {e}")
-            return None, []
-
         oz_per_coin = self.detect_oz_per_coin(path, html_text)
         for listing in listings:
-            listing["quantity"] = self.extract_quantity(listing["title"])
+            # The title is already lowercased (and cached), so skip
+            # extract_quantity's own .lower() and go straight to the cache.
+            title = listing_title_lc(listing)
+            listing["quantity"] = self._quantity_for(title) if title else 1
 
         return oz_per_coin, listings
 
@@ -688,6 +876,9 @@ class EbayOfflineAnalyzer:
         """
         Try to match the listing title/quantity against NUMISMATIC_RULES.
 
+        Rules are tried in table order, so when several rules fit the title
+        (e.g. "1892-O Micro O" and "1892-O") the more specific one wins.
+
         If a rule matches:
           - We assume the coin is at least est_value to a dealer
             in G–VG, *ignoring* melt.
@@ -696,26 +887,14 @@ class EbayOfflineAnalyzer:
         If nothing matches, return None and the listing is treated
         purely as a melt-play.
         """
-        title = (listing.get("title") or "").lower()
-        qty = listing.get("quantity", 1)
-
-        for rule in NUMISMATIC_RULES:
-            max_qty = rule.get("max_qty")
-            if max_qty is not None and qty > max_qty:
-                continue
-
-            must = rule.get("must_contain") or []
-            # All tokens in must_contain must appear in the title
-            if any(token.lower() not in title for token in must):
-                continue
-
-            if rule["pattern"].search(title):
-                return {
-                    "label": rule["label"],
-                    "est_value": float(rule["est_value"]),
-                }
-
-        return None
+        title = listing_title_lc(listing)
+        rule = match_numismatic_rule(title, listing.get("quantity", 1))
+        if rule is None:
+            return None
+        return {
+            "label": rule.label,
+            "est_value": rule.est_value,
+        }
 
     def is_numismatic_candidate_sane(self, listing, rule_info, calc):
         """
@@ -728,7 +907,7 @@ class EbayOfflineAnalyzer:
           - Ultra-expensive dates (est_value >= $1000) that are
             raw, ungraded, and priced under ~15% of their floor.
         """
-        title = (listing.get("title") or "").lower()
+        title = listing_title_lc(listing)
         est_value = float(rule_info.get("est_value", 0.0))
         effective_cost = float(calc.get("effective_cost", 0.0))
 
@@ -738,7 +917,7 @@ class EbayOfflineAnalyzer:
             return False
 
         # 2) "Brand New" + 1800s date is extremely suspicious
-        if "brand new" in title and re.search(r"\b18\d{2}\b", title):
+        if "brand new" in title and self.OLD_DATE_RE.search(title):
             return False
 
         # 3) Extra guard for very high-end material (Seated keys, 1893-S, etc.)
@@ -815,37 +994,52 @@ class EbayOfflineAnalyzer:
 
         filename_label = os.path.basename(path)
 
+        # Read config once, outside the per-listing loop
+        spot_price = config["spot_price"]
+        pawn_payout_pct = config["pawn_payout_pct"]
+        bid_offset = config.get("bid_offset", 0.0)
+        min_margin = config["min_margin"]
+        max_margin = config["max_margin"]
+
         hits = []
         for listing in listings:
             calc = self.calculate_silver_profit(
                 listing,
                 oz_per_coin,
-                config["spot_price"],
-                config["pawn_payout_pct"],
-                config.get("bid_offset", 0.0),
+                spot_price,
+                pawn_payout_pct,
+                bid_offset,
             )
             # cache calc for display
             listing["_silver_calc"] = calc
 
             # Normal melt-based HIT
-            silver_hit = (
-                config["min_margin"] <= calc["margin_pct"] <= config["max_margin"]
-            )
+            silver_hit = min_margin <= calc["margin_pct"] <= max_margin
 
             # Numismatic override HIT (using est dealer value instead of melt)
             numis_hit, _ = self.check_numismatic_override(listing, calc, config)
 
             if silver_hit or numis_hit:
-                hits.append((os.path.basename(path), listing, calc, oz_per_coin))
+                hits.append((filename_label, listing, calc, oz_per_coin))
 
         # Print per-file table (old behavior), but now aware of overrides.
         # NOTE: the on-screen table shows melt margin in the "Found" column;
         # if a coin is only a HIT because of numismatic_override, it will
         # still show "HIT!" even with a negative melt margin.
-        self.print_silver_table(filename_label, listings, oz_per_coin, config)
+        # In a worker pool the table is printed by report_file instead.
+        if not config.get("defer_report"):
+            self.print_silver_table(filename_label, listings, oz_per_coin, config)
 
         return oz_per_coin, listings, hits
 
+    def report_file(self, path, result, config):
+        """Print the per-file table for an analyze_file result (used by pooled runs)."""
+        oz_per_coin, listings, _ = result
+        if oz_per_coin is None:
+            # analyze_file returned early; nothing was printed in that case either
+            return
+        self.print_silver_table(os.path.basename(path), listings, oz_per_coin, config)
+
     # ---------- Filters & math ----------
     def filter_by_quantity(self, listings, min_quantity):
         if not min_quantity:
@@ -853,9 +1047,11 @@ class EbayOfflineAnalyzer:
 
         filtered = []
         for listing in listings:
-            qty = self.extract_quantity(listing["title"])
+            # parse_file has already stamped the quantity
+            qty = listing.get("quantity")
+            if qty is None:
+                qty = listing["quantity"] = self.extract_quantity(listing["title"])
             if qty >= min_quantity:
-                listing["quantity"] = qty
                 filtered.append(listing)
         return filtered
 
@@ -865,7 +1061,7 @@ class EbayOfflineAnalyzer:
         bl = [w.lower() for w in blacklist]
         filtered = []
         for listing in listings:
-            tl = listing["title"].lower()
+            tl = listing_title_lc(listing)
             if not any(word in tl for word in bl):
                 filtered.append(listing)
         return filtered
@@ -968,7 +1164,10 @@ def build_consolidated_hits_body(hits, config):
         # Keep it simple if no hits
         return "<html><body><pre>No HITs found.</pre></body></html>"
 
-    # Sort hits by absolute end time if possible, otherwise by minutes-left
+    # Sort hits by absolute end time if possible, otherwise by minutes-left.
+    # One "now" for every fallback key, so they are consistent with each other.
+    now = datetime.now()
+
     def sort_key(entry):
         filename_label, listing, calc, oz_per_coin = entry
         tl = listing.get("time_left")
@@ -980,7 +1179,7 @@ def build_consolidated_hits_body(hits, config):
 
         # Fallback: approximate using "Xh Ym" relative minutes
         mins = parse_time_left_to_minutes_for_sort(tl)
-        return datetime.now() + timedelta(minutes=mins)
+        return now + timedelta(minutes=mins)
 
     hits_sorted = sorted(hits, key=sort_key)
 
@@ -1181,6 +1380,8 @@ def main():
         "min_quantity": None,
         "blacklist": [],
         "bid_offset": BID_OFFSET,
+        "parse_executor": PARSE_EXECUTOR,
+        "max_parse_workers": MAX_PARSE_WORKERS,
     }
 
     # Prompt user for filters